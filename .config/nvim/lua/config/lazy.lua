@@ -22,19 +22,26 @@ require("lazy").setup({
     { import = "plugins" },
   },
   defaults = {
-    -- By default, only LazyVim plugins will be lazy-loaded. Your custom plugins will load during startup.
-    -- If you know what you're doing, you can set this to `true` to have all your custom plugins lazy-loaded by default.
-    lazy = false,
+    -- Custom plugins are lazy-loaded too: give each spec in lua/plugins/ an `event`, `cmd`, `ft` or `keys`
+    -- trigger, or set `lazy = false` on the few that really have to load during startup.
+    lazy = true,
     -- It's recommended to leave version=false for now, since a lot the plugin that support versioning,
     -- have outdated releases, which may break your Neovim install.
     version = false, -- always use the latest git commit
     -- version = "*", -- try installing the latest stable version for plugins that support semver
   },
-  install = { colorscheme = { "tokyonight", "habamax" } },
+  install = {
+    -- NVIM_OFFLINE=1 (set by nvim-startup-bench) never clones missing plugins
+    missing = vim.env.NVIM_OFFLINE == nil,
+    colorscheme = { "tokyonight", "habamax" },
+  },
   checker = {
-    enabled = true, -- check for plugin updates periodically
+    -- check for plugin updates at most once a day (lazy.nvim keeps the time of the last check in its state
+    -- file), never under NVIM_OFFLINE=1
+    enabled = vim.env.NVIM_OFFLINE == nil,
     notify = false, -- notify on update
-  }, -- automatically check for plugin updates
+    frequency = 24 * 60 * 60, -- seconds between checks
+  },
   performance = {
     rtp = {
       -- disable some rtp plugins
@@ -1,3 +1,55 @@
 -- Options are automatically loaded before lazy.nvim startup
 -- Default options that are always set: https://github.com/LazyVim/LazyVim/blob/main/lua/lazyvim/config/options.lua
 -- Add any additional options here
+
+-- Big-file mode, same threshold as ~/.vimrc: files larger than vim.g.bigfile_raw_size bytes (50 MiB, or
+-- $BIGFILE_SIZE) are opened raw. Filetype detection and FileType are skipped while the buffer is read, so
+-- treesitter, LSP, syntax and ftplugins never attach, and swap, undo history and folding are switched off.
+-- Smaller big files are still handled by LazyVim's own bigfile support (snacks.bigfile).
+vim.g.bigfile_raw_size = tonumber(vim.env.BIGFILE_SIZE or "") or 50 * 1024 * 1024
+
+local bigfile = vim.api.nvim_create_augroup("bigfile_raw", { clear = true })
+vim.api.nvim_create_autocmd("BufReadPre", {
+  group = bigfile,
+  callback = function(ev)
+    local stat = (vim.uv or vim.loop).fs_stat(ev.match)
+    if not stat or stat.size <= vim.g.bigfile_raw_size then
+      return
+    end
+    vim.b[ev.buf].bigfile = true
+    vim.opt.eventignore:append({ "FileType", "BufReadPost" })
+    vim.bo[ev.buf].swapfile = false
+    vim.bo[ev.buf].undofile = false
+    vim.bo[ev.buf].undolevels = -1
+    vim.bo[ev.buf].autoread = false
+    vim.bo[ev.buf].readonly = true
+    vim.bo[ev.buf].bufhidden = "unload"
+    vim.api.nvim_create_autocmd("BufWinEnter", {
+      group = bigfile,
+      buffer = ev.buf,
+      once = true,
+      callback = function()
+        vim.opt.eventignore:remove({ "FileType", "BufReadPost" })
+        vim.wo.foldenable = false
+        vim.wo.foldmethod = "manual"
+        vim.wo.wrap = false
+        vim.bo[ev.buf].syntax = "OFF"
+      end,
+    })
+  end,
+})
+
+-- :BigSlice {file} [first] [lines] shows lines first..first+lines-1 (default 1..10000) of a file in a scratch
+-- buffer without reading the rest of it.
+vim.api.nvim_create_user_command("BigSlice", function(opts)
+  local file, first, lines = opts.fargs[1], tonumber(opts.fargs[2]) or 1, tonumber(opts.fargs[3]) or 10000
+  local last = first + lines - 1
+  vim.cmd.enew()
+  vim.bo.buftype = "nofile"
+  vim.bo.bufhidden = "wipe"
+  vim.bo.swapfile = false
+  vim.bo.undolevels = -1
+  local out = vim.fn.systemlist({ "sed", "-n", ("%d,%dp;%dq"):format(first, last, last), file })
+  vim.api.nvim_buf_set_lines(0, 0, -1, false, out)
+  vim.api.nvim_buf_set_name(0, ("%s:%d-%d"):format(file, first, last))
+end, { nargs = "+", complete = "file" })